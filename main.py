@@ -0,0 +1,34 @@
+"""Entry point for the network failover automation service."""
+
+import logging
+import time
+
+from src.monitoring.collector import NetworkMonitor
+from src.monitoring.presistence import MetricsPersistence
+from src.router.interfaces import InterfaceManager
+from src.router.mikrotik import MikrotikClient
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+    )
+
+    router = MikrotikClient()
+    interface_manager = InterfaceManager(router)
+    persistence = MetricsPersistence()
+    monitor = NetworkMonitor(interface_manager, persistence)
+
+    monitor.start_monitoring()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        monitor.stop_monitoring()
+        persistence.close()
+        router.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Configuration for the network failover automation service."""
+
+# RouterOS API connection details
+ROUTER = {
+    'host': '192.168.88.1',
+    'username': 'admin',
+    'password': '',
+    'port': 8728,
+}
+
+# Interfaces managed by the failover logic
+INTERFACES = {
+    'primary': 'ether1-wan',
+    'secondary': 'lte1',
+}
+
+# External hosts pinged to judge interface health
+PING_TARGETS = [
+    '8.8.8.8',
+    '1.1.1.1',
+]
+
+# Number of pings sent per target on each check
+PING_COUNT = 5
+
+# Health thresholds for an interface to be considered usable
+THRESHOLDS = {
+    'latency': 150.0,            # average latency in ms
+    'packet_loss': 20.0,         # percent
+    'consecutive_failures': 3,   # failed checks before failover
+}
+
+# Seconds between monitoring checks
+CHECK_INTERVAL = 30
+
+# SQLite database used for metrics history
+DB_PATH = 'data/metrics.db'
+
+# AI failure-prediction model
+MODEL_PATH = 'data/failover_model.pkl'
+TRAINING_DAYS = 14
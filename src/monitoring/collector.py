@@ -0,0 +1,188 @@
+"""Periodic collection and evaluation of interface metrics."""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import deque
+
+from src.config.settings import CHECK_INTERVAL, THRESHOLDS
+
+logger = logging.getLogger(__name__)
+
+# Samples kept in memory per interface
+HISTORY_SIZE = 1000
+
+# Static configuration, hoisted once out of the per-tick path
+_CONSECUTIVE_FAILURES_THRESHOLD = THRESHOLDS['consecutive_failures']
+
+# Metrics batches allowed to queue up for the decision thread
+DECISION_QUEUE_SIZE = 4
+
+# Placed on the decision queue to tell the decision thread to exit
+_SENTINEL = object()
+
+
+class NetworkMonitor:
+    """Runs the monitoring loop and triggers failover when needed."""
+
+    def __init__(self, interface_manager, persistence):
+        self.interface_manager = interface_manager
+        self.persistence = persistence
+        self.metrics_history = {}
+        self.consecutive_failures = {}
+        self._running = False
+        self._thread = None
+        self._decision_q = queue.Queue(maxsize=DECISION_QUEUE_SIZE)
+        self._decision_thread = None
+
+    def collect_metrics(self):
+        """Collect one round of metrics, store them, and keep history."""
+        # The formatted timestamp only feeds debug logging, so skip the
+        # strftime round trip entirely when DEBUG is off.
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            formatted_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
+
+        metrics = self.interface_manager.check_interfaces()
+
+        rows = []
+        for interface, interface_metrics in metrics.items():
+            if interface not in self.metrics_history:
+                self.metrics_history[interface] = deque(maxlen=HISTORY_SIZE)
+            self.metrics_history[interface].append(interface_metrics)
+
+            rows.append((interface, interface_metrics))
+
+            if debug_enabled:
+                # %-style args defer formatting to the logging module
+                logger.debug(
+                    "[%s] Interface %s: status=%s, latency=%s, packet_loss=%s",
+                    formatted_time,
+                    interface,
+                    interface_metrics['status'],
+                    interface_metrics['latency'],
+                    interface_metrics['packet_loss'],
+                )
+
+        self.persistence.store_metrics_many(rows)
+
+        return metrics
+
+    def process_metrics(self, metrics):
+        """Update failure counters and perform failover if warranted."""
+        # Bind the hot attribute lookups once; on the small boards this
+        # monitor targets, the repeated probes add up at every tick.
+        manager = self.interface_manager
+        is_healthy = manager.is_interface_healthy
+        failures = self.consecutive_failures
+        warn = logger.warning
+
+        health = {
+            interface: is_healthy(interface_metrics)
+            for interface, interface_metrics in metrics.items()
+        }
+
+        for interface, healthy in health.items():
+            if healthy:
+                failures[interface] = 0
+            else:
+                failures[interface] = failures.get(interface, 0) + 1
+                warn(
+                    "Interface %s unhealthy (%d consecutive failures)",
+                    interface,
+                    failures[interface],
+                )
+
+        active = manager.current_active
+        if failures.get(active, 0) >= _CONSECUTIVE_FAILURES_THRESHOLD:
+            target = manager.evaluate_failover_need(
+                metrics[manager.primary_interface],
+                metrics[manager.secondary_interface],
+                health=health,
+            )
+            if target is not None:
+                manager.perform_failover(target)
+                failures[target] = 0
+
+    def get_metrics_history(self, interface, limit=100):
+        """Return up to `limit` most recent in-memory samples."""
+        history = self.metrics_history.get(interface, ())
+        return list(
+            itertools.islice(history, max(0, len(history) - limit), len(history))
+        )
+
+    def get_latest_metrics(self, interface):
+        """Return the most recent sample for an interface, or None."""
+        history = self.metrics_history.get(interface)
+        return history[-1] if history else None
+
+    def start_monitoring(self):
+        """Start the sampling and decision threads."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._monitoring_loop, daemon=True, name='monitor'
+        )
+        self._decision_thread = threading.Thread(
+            target=self._decision_loop, daemon=True, name='decision'
+        )
+        self._thread.start()
+        self._decision_thread.start()
+        logger.info("Monitoring started")
+
+    def stop_monitoring(self):
+        """Stop the sampling and decision threads."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._decision_thread is not None:
+            self._decision_q.put(_SENTINEL)
+            self._decision_thread.join()
+            self._decision_thread = None
+        logger.info("Monitoring stopped")
+
+    def _monitoring_loop(self):
+        # Deadline-based schedule: sleeping for the remainder of each
+        # interval keeps a fixed wall-clock cadence regardless of how long
+        # the checks themselves take, instead of drifting by the work time.
+        collect = self.collect_metrics
+        enqueue = self._decision_q.put_nowait
+        monotonic = time.monotonic
+        sleep = time.sleep
+
+        next_tick = monotonic() + CHECK_INTERVAL
+        while self._running:
+            try:
+                metrics = collect()
+                # Hand the failover decision to its own thread so a slow
+                # route update never delays the next sample.
+                try:
+                    enqueue(metrics)
+                except queue.Full:
+                    logger.warning(
+                        "Decision queue full, dropping metrics batch"
+                    )
+            except Exception:
+                logger.exception("Error in monitoring loop")
+            sleep_for = next_tick - monotonic()
+            if sleep_for > 0:
+                sleep(sleep_for)
+                next_tick += CHECK_INTERVAL
+            else:
+                # Fell behind by at least a full interval; reset the
+                # deadline instead of firing a burst of catch-up ticks.
+                next_tick = monotonic() + CHECK_INTERVAL
+
+    def _decision_loop(self):
+        while True:
+            metrics = self._decision_q.get()
+            if metrics is _SENTINEL:
+                break
+            try:
+                self.process_metrics(metrics)
+            except Exception:
+                logger.exception("Error in decision loop")
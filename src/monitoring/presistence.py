@@ -0,0 +1,192 @@
+"""SQLite persistence for collected interface metrics."""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from src.config.settings import DB_PATH
+
+logger = logging.getLogger(__name__)
+
+# Most rows the writer thread folds into one transaction
+MAX_BATCH = 256
+
+# Placed on the queue to tell the writer thread to exit
+_SENTINEL = object()
+
+
+class MetricsPersistence:
+    """Stores interface metrics rows in a local SQLite database.
+
+    One connection is opened up front and reused for every operation.
+    Writes go through an in-process queue drained by a background thread
+    that folds queued rows into one transaction per batch, so the
+    monitoring loop never blocks on disk I/O.
+    """
+
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
+        self._ensure_db()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._apply_pragmas(self._conn)
+        self._q = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, daemon=True, name='metrics-writer'
+        )
+        self._writer.start()
+
+    @staticmethod
+    def _apply_pragmas(conn):
+        """Tune a connection for the write-every-tick, scan-by-range load."""
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=67108864')
+
+    def _ensure_db(self):
+        """Create the database file, table and indexes if missing."""
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+        self._apply_pragmas(conn)
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS interface_metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                interface TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                timestamp_readable TEXT NOT NULL,
+                status TEXT NOT NULL,
+                latency REAL,
+                packet_loss REAL
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_metrics_interface_ts
+            ON interface_metrics (interface, timestamp)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_metrics_ts
+            ON interface_metrics (timestamp)
+        ''')
+        conn.commit()
+        conn.close()
+
+    _INSERT_SQL = '''
+        INSERT INTO interface_metrics
+            (interface, timestamp, timestamp_readable, status, latency, packet_loss)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+
+    def store_metrics(self, interface, metrics):
+        """Queue one metrics row for an interface."""
+        self._q.put((interface, metrics))
+
+    def store_metrics_many(self, items):
+        """Queue many (interface, metrics) pairs for writing."""
+        for item in items:
+            self._q.put(item)
+
+    def _writer_loop(self):
+        """Drain the queue, writing one transaction per batch of rows."""
+        while True:
+            item = self._q.get()
+            if item is _SENTINEL:
+                break
+            batch = [item]
+            stop = False
+            while len(batch) < MAX_BATCH:
+                try:
+                    item = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _SENTINEL:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self._write_batch(batch)
+            except Exception:
+                logger.exception("Failed to write metrics batch")
+            if stop:
+                break
+
+    def _write_batch(self, items):
+        """Insert many (interface, metrics) pairs in one transaction."""
+        rows = [
+            (
+                interface,
+                metrics['timestamp'],
+                # time.strftime avoids allocating a datetime object per row
+                time.strftime(
+                    '%Y-%m-%d %H:%M:%S', time.localtime(metrics['timestamp'])
+                ),
+                metrics['status'],
+                metrics['latency'],
+                metrics['packet_loss'],
+            )
+            for interface, metrics in items
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(self._INSERT_SQL, rows)
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def get_metrics(self, interface, since=None, limit=1000):
+        """Return recent metrics rows for an interface, newest first."""
+        with self._lock:
+            if since is not None:
+                cursor = self._conn.execute(
+                    '''
+                    SELECT * FROM interface_metrics
+                    WHERE interface = ? AND timestamp >= ?
+                    ORDER BY timestamp DESC LIMIT ?
+                    ''',
+                    (interface, since, limit),
+                )
+            else:
+                cursor = self._conn.execute(
+                    '''
+                    SELECT * FROM interface_metrics
+                    WHERE interface = ?
+                    ORDER BY timestamp DESC LIMIT ?
+                    ''',
+                    (interface, limit),
+                )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def prune_older_than(self, days):
+        """Delete rows older than `days` days and compact the database.
+
+        Meant to run periodically (e.g. nightly) so the indexes stay
+        small enough to remain cache-hot.
+        """
+        cutoff = time.time() - days * 86400
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM interface_metrics WHERE timestamp < ?', (cutoff,)
+            )
+            self._conn.execute('VACUUM')
+            return cursor.rowcount
+
+    def close(self):
+        """Flush queued rows, stop the writer thread and close the database."""
+        self._q.put(_SENTINEL)
+        self._writer.join()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,191 @@
+"""Interface health checks and failover decisions."""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config.settings import INTERFACES, PING_TARGETS, THRESHOLDS
+
+logger = logging.getLogger(__name__)
+
+# Pings sent by the cheap first-target probe before a full check
+PROBE_COUNT = 2
+
+# Static configuration, hoisted once so the per-tick health checks skip
+# the repeated dict probes.
+_LATENCY_THRESHOLD = THRESHOLDS['latency']
+_PACKET_LOSS_THRESHOLD = THRESHOLDS['packet_loss']
+
+
+class InterfaceManager:
+    """Tracks the health of the WAN interfaces and performs failover."""
+
+    def __init__(self, router):
+        self.router = router
+        self.primary_interface = INTERFACES['primary']
+        self.secondary_interface = INTERFACES['secondary']
+        self.current_active = self.primary_interface
+        # One worker per (interface, target) pair so a full check runs all
+        # pings concurrently instead of paying for them back to back.
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(INTERFACES) * len(PING_TARGETS),
+            thread_name_prefix='ping',
+        )
+        # Orchestrates the per-interface checks. Kept separate from the
+        # ping pool so an interface task can never occupy the worker its
+        # own pings are queued behind.
+        self._iface_executor = ThreadPoolExecutor(
+            max_workers=len(INTERFACES),
+            thread_name_prefix='iface',
+        )
+
+    def _down_metrics(self, interface_name, now):
+        """Metrics dict for an interface that is administratively down."""
+        return {
+            'interface': interface_name,
+            'status': 'down',
+            'latency': None,
+            'packet_loss': 100.0,
+            'timestamp': now,
+        }
+
+    def _aggregate_metrics(self, interface_name, ping_results, now):
+        """Fold per-target ping results into one metrics dict."""
+        latencies = [r['latency'] for r in ping_results if r['latency'] is not None]
+        packet_losses = [r['packet_loss'] for r in ping_results]
+
+        avg_latency = sum(latencies) / len(latencies) if latencies else None
+        avg_packet_loss = (
+            sum(packet_losses) / len(packet_losses) if packet_losses else 100.0
+        )
+
+        return {
+            'interface': interface_name,
+            'status': 'up',
+            'latency': avg_latency,
+            'packet_loss': avg_packet_loss,
+            'timestamp': now,
+        }
+
+    def get_interface_metrics(self, interface_name, status_map=None, now=None):
+        """Collect status, latency and packet loss for one interface.
+
+        A caller checking several interfaces can pass the status map from
+        one `get_interface_status_map` call to avoid refetching the table,
+        and a shared `now` so every row of the pass carries one timestamp.
+        """
+        if now is None:
+            now = time.time()
+        if status_map is not None:
+            interface_status = status_map.get(interface_name)
+        else:
+            interface_status = self.router.get_interface_status(interface_name)
+        if interface_status is None or interface_status.get('running') != 'true':
+            return self._down_metrics(interface_name, now)
+
+        # A short probe against the first target runs alongside the
+        # full-count pings of the remaining targets, so the healthy path
+        # still costs one ping round. A link that reports running but is
+        # actually dead shows total loss on the probe within PROBE_COUNT
+        # seconds, and the verdict is returned without waiting for the
+        # other targets to time out — the case where detection latency
+        # matters most.
+        first_target = PING_TARGETS[0]
+        probe_future = self._executor.submit(
+            self.router.check_interface_connectivity,
+            interface_name, first_target, PROBE_COUNT,
+        )
+        rest_futures = [
+            self._executor.submit(
+                self.router.check_interface_connectivity, interface_name, target
+            )
+            for target in PING_TARGETS[1:]
+        ]
+
+        probe = probe_future.result()
+        if probe['packet_loss'] >= 100.0:
+            # Dead link; any still-running pings finish in the background.
+            return self._aggregate_metrics(interface_name, [probe], now)
+        if probe['packet_loss'] > 0.0:
+            # Ambiguous short sample: one dropped packet out of
+            # PROBE_COUNT would skew the average, so escalate to a
+            # full-count ping and use that instead.
+            probe = self.router.check_interface_connectivity(
+                interface_name, first_target
+            )
+
+        # Results are gathered in submission order.
+        ping_results = [probe] + [future.result() for future in rest_futures]
+        return self._aggregate_metrics(interface_name, ping_results, now)
+
+    def check_interfaces(self):
+        """Collect metrics for the primary and secondary interfaces.
+
+        Both interfaces are checked concurrently and each check fans its
+        pings out over the ping pool, so the wall time of a full pass is
+        roughly one ping round instead of the sum of every ping across
+        every interface — and a dead link resolves in one probe.
+        """
+        now = time.time()
+        status_map = self.router.get_interface_status_map()
+        futures = {
+            interface_name: self._iface_executor.submit(
+                self.get_interface_metrics, interface_name, status_map, now
+            )
+            for interface_name in (self.primary_interface, self.secondary_interface)
+        }
+        return {
+            interface_name: future.result()
+            for interface_name, future in futures.items()
+        }
+
+    def is_interface_healthy(self, metrics):
+        """Check one interface's metrics against the configured thresholds."""
+        if metrics['status'] != 'up':
+            return False
+        if metrics['packet_loss'] > _PACKET_LOSS_THRESHOLD:
+            return False
+        if metrics['latency'] is None or metrics['latency'] > _LATENCY_THRESHOLD:
+            return False
+        return True
+
+    def evaluate_failover_need(self, primary_metrics, secondary_metrics, health=None):
+        """Return the interface to switch to, or None if no change is needed.
+
+        Callers that already evaluated interface health this tick can pass
+        the results as `health` ({interface: bool}) to avoid re-running
+        the threshold checks.
+        """
+        if health is not None:
+            primary_healthy = health[self.primary_interface]
+            secondary_healthy = health[self.secondary_interface]
+        else:
+            primary_healthy = self.is_interface_healthy(primary_metrics)
+            secondary_healthy = self.is_interface_healthy(secondary_metrics)
+
+        # The active interface is always one of the two just evaluated.
+        if self.current_active == self.primary_interface:
+            current_healthy = primary_healthy
+        else:
+            current_healthy = secondary_healthy
+
+        if self.current_active == self.primary_interface:
+            if not current_healthy and secondary_healthy:
+                return self.secondary_interface
+        else:
+            # Prefer failing back to the primary as soon as it recovers.
+            if primary_healthy:
+                return self.primary_interface
+        return None
+
+    def perform_failover(self, target_interface):
+        """Reorder routing distances so traffic flows over the target."""
+        logger.warning(f"Performing failover to {target_interface}")
+        if target_interface == self.primary_interface:
+            self.router.update_routing_priority(self.primary_interface, 1)
+            self.router.update_routing_priority(self.secondary_interface, 2)
+        else:
+            self.router.update_routing_priority(self.primary_interface, 3)
+            self.router.update_routing_priority(self.secondary_interface, 1)
+        self.current_active = target_interface
+        logger.info(f"Active interface is now {self.current_active}")
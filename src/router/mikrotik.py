@@ -0,0 +1,205 @@
+"""Client for the MikroTik RouterOS API."""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from librouteros import connect
+from librouteros.exceptions import ConnectionClosed, FatalError
+from librouteros.query import Key
+
+from src.config.settings import PING_COUNT, ROUTER
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent API connections; sized for the ping fan-out.
+POOL_SIZE = 4
+
+# Seconds a fetched interface table stays fresh for status lookups
+STATUS_CACHE_TTL = 1.0
+
+
+class MikrotikClient:
+    """Thin wrapper around librouteros for the operations we need.
+
+    librouteros connections are not thread-safe, so the client keeps a
+    small pool of authenticated handles. Connections are opened lazily up
+    to the pool size and reused, which keeps the TCP+login handshake off
+    the hot path and lets concurrent pings proceed in parallel.
+    """
+
+    def __init__(self, host=None, username=None, password=None, port=None,
+                 pool_size=POOL_SIZE):
+        self.host = host or ROUTER['host']
+        self.username = username or ROUTER['username']
+        self.password = password or ROUTER['password']
+        self.port = port or ROUTER['port']
+        self.pool_size = pool_size
+        self._pool = queue.Queue(maxsize=pool_size)
+        self._created = 0
+        self._created_lock = threading.Lock()
+        self._status_cache = None
+        self._status_cache_time = 0.0
+        self._status_cache_lock = threading.Lock()
+
+    def _connect(self):
+        api = connect(
+            host=self.host,
+            username=self.username,
+            password=self.password,
+            port=self.port,
+        )
+        logger.info(f"Connected to router at {self.host}")
+        return api
+
+    def _acquire(self):
+        """Take a connection from the pool, opening a new one if allowed."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._created_lock:
+            below_limit = self._created < self.pool_size
+            if below_limit:
+                self._created += 1
+        if below_limit:
+            try:
+                return self._connect()
+            except Exception:
+                with self._created_lock:
+                    self._created -= 1
+                raise
+        # Pool is at capacity; wait for a connection to be released.
+        return self._pool.get()
+
+    def _release(self, api):
+        self._pool.put(api)
+
+    def _discard(self, api):
+        """Drop a broken connection; a fresh one is opened on next acquire."""
+        try:
+            api.close()
+        except Exception:
+            pass
+        with self._created_lock:
+            self._created -= 1
+
+    @contextmanager
+    def _lease(self):
+        """Borrow a pooled connection for the duration of one operation.
+
+        The handle is always returned to the pool or discarded, whatever
+        the operation raises — a leaked handle would shrink the pool
+        until every acquire blocks forever.
+        """
+        api = self._acquire()
+        try:
+            yield api
+        except (ConnectionClosed, FatalError, ConnectionError, OSError):
+            # The transport is broken or unusable; drop the handle so a
+            # fresh one is opened on the next acquire.
+            self._discard(api)
+            raise
+        except BaseException:
+            # Command-level errors (e.g. a RouterOS trap for a bad
+            # interface name) leave the connection healthy; reuse it.
+            self._release(api)
+            raise
+        else:
+            self._release(api)
+
+    def close(self):
+        """Close every pooled connection."""
+        while True:
+            try:
+                api = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(api)
+
+    def get_interfaces(self):
+        """Return the full interface table from the router."""
+        with self._lease() as api:
+            return list(api.path('interface'))
+
+    def get_interface_status_map(self):
+        """Return {name: entry} for every interface on the router.
+
+        The table is fetched with a single round trip and cached briefly,
+        so back-to-back status lookups within one monitoring pass share
+        one fetch instead of pulling the whole table per interface.
+        """
+        now = time.monotonic()
+        with self._status_cache_lock:
+            if (self._status_cache is not None
+                    and now - self._status_cache_time < STATUS_CACHE_TTL):
+                return self._status_cache
+        interfaces = self.get_interfaces()
+        status_map = {i['name']: i for i in interfaces if 'name' in i}
+        with self._status_cache_lock:
+            self._status_cache = status_map
+            self._status_cache_time = time.monotonic()
+        return status_map
+
+    def get_interface_status(self, interface_name):
+        """Return the interface entry for the given name, or None."""
+        return self.get_interface_status_map().get(interface_name)
+
+    def check_interface_connectivity(self, interface_name, target, count=PING_COUNT):
+        """Ping a target over a specific interface and aggregate the results.
+
+        Returns a dict with the target, average latency in ms (None if no
+        replies came back) and the packet loss percentage.
+        """
+        with self._lease() as api:
+            ping = api.path('ping')
+            results = list(ping(address=target, interface=interface_name, count=count))
+
+        # Single pass over the replies; no intermediate list of times.
+        received = 0
+        total_time = 0.0
+        for r in results:
+            t = r.get('time')
+            if t is not None:
+                received += 1
+                total_time += float(t)
+
+        packet_loss = (count - received) * 100.0 / count
+        avg_time = total_time / received if received else None
+
+        return {
+            'target': target,
+            'latency': avg_time,
+            'packet_loss': packet_loss,
+        }
+
+    def update_routing_priority(self, interface_name, distance):
+        """Set the distance on every route whose gateway is the interface."""
+        with self._lease() as api:
+            ip_route = api.path('ip/route')
+            # Filter on the router instead of pulling the whole route
+            # table and scanning it here.
+            target_routes = list(
+                ip_route.select(Key('.id'), Key('gateway'), Key('distance'))
+                .where(Key('gateway') == interface_name)
+            )
+            for route in target_routes:
+                ip_route.update(**{'.id': route['.id'], 'distance': distance})
+                logger.info(
+                    f"Set distance={distance} on route {route['.id']} "
+                    f"(gateway {route.get('gateway')})"
+                )
+
+    def execute_script(self, script_name):
+        """Run a named script stored on the router. Returns True if found."""
+        with self._lease() as api:
+            scripts = api.path('system/script')
+            for script in list(scripts):
+                if script.get('name') == script_name:
+                    scripts('run', **{'.id': script['.id']})
+                    logger.info(f"Executed router script '{script_name}'")
+                    return True
+        logger.warning(f"Router script '{script_name}' not found")
+        return False